@@ -10,11 +10,15 @@ Usage:
     python demo_all_plots.py
 
 Output:
-    All figures saved to ./sample_outputs/
+    All figures saved to ./sample_outputs/ (PNG by default; set
+    MCM_SAVE_FORMATS=png,pdf to also write PDF copies)
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable, Optional
 
 # Add parent directories to path for imports
 skill_root = Path(__file__).parent.parent.parent
@@ -30,6 +34,8 @@ from templates.visualization import (
     COLOR_LIST,
     DIMENSIONS,
     save_figure,
+    get_save_formats,
+    PREVIEW_PNG_COMPRESS_LEVEL,
     add_subplot_labels,
 )
 
@@ -56,15 +62,73 @@ from templates.visualization.plot_templates import (
 OUTPUT_DIR = Path(__file__).parent / "sample_outputs"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+SAVE_FORMATS = get_save_formats()
+SAVE_SUFFIX = "/".join(SAVE_FORMATS)
+
+# Shared sample data, generated once per run (see make_fixtures)
+_FIXTURES = {}
+
+
+def fast_corrcoef(X: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation between the columns of X via a single matrix product.
+    
+    Equivalent to np.corrcoef(X.T), but the centered/normalized form lets
+    the whole computation dispatch to one BLAS GEMM call.
+    
+    Args:
+        X: 2D array (n_samples x n_variables)
+    
+    Returns:
+        (n_variables x n_variables) correlation matrix
+    """
+    Xc = X - X.mean(axis=0)
+    Xn = Xc / np.linalg.norm(Xc, axis=0)
+    return np.clip(Xn.T @ Xn, -1.0, 1.0)
+
+
+def make_fixtures() -> dict:
+    """
+    Generates the random sample data shared by the demos.
+    
+    The arrays are drawn once from a single seeded Generator and cached in
+    _FIXTURES, so demos reuse them instead of re-seeding and regenerating.
+    Demos must copy an array before modifying it.
+    
+    Returns:
+        The fixtures dict
+    """
+    if _FIXTURES:
+        return _FIXTURES
+    
+    rng = np.random.default_rng(42)
+    
+    # Noisy sine wave on 100 points (multi-panel demo)
+    x = np.linspace(0, 10, 100)
+    _FIXTURES['sine100'] = (x, np.sin(x) + rng.normal(0, 0.3, 100))
+    
+    # Standard normal matrix (heatmap demo) plus two extra noise columns
+    _FIXTURES['normal100x8'] = rng.standard_normal((100, 8))
+    _FIXTURES['noise100x2'] = rng.standard_normal((100, 2))
+    
+    # Random-walk increments: 50 historical + 20 forecast steps
+    _FIXTURES['steps70'] = rng.normal(0, 2, 70)
+    
+    # Cost samples and noise for the Pareto demo
+    _FIXTURES['pareto50'] = (
+        rng.uniform(10, 100, 50),
+        rng.standard_normal(50),
+    )
+    
+    return _FIXTURES
+
 
 def demo_time_series():
     """Demo 1: Time Series Forecast Plot"""
     print("Generating: Time Series Forecast...")
     
-    use_mcm_style()
-    
-    # Generate sample data
-    np.random.seed(42)
+    # Sample data
+    steps = make_fixtures()['steps70']
     n_historical = 50
     n_forecast = 20
     
@@ -72,10 +136,11 @@ def demo_time_series():
     dates = np.arange(n_historical + n_forecast)
     
     # Historical data
-    y_history = 100 + np.cumsum(np.random.randn(n_historical) * 2)
+    y_history = steps[:n_historical].cumsum()
+    y_history += 100
     
     # Forecast data
-    y_forecast = np.cumsum(np.random.randn(n_forecast) * 2)
+    y_forecast = steps[n_historical:].cumsum()
     y_ci_lower = y_forecast - np.linspace(5, 15, n_forecast)
     y_ci_upper = y_forecast + np.linspace(5, 15, n_forecast)
     
@@ -90,26 +155,26 @@ def demo_time_series():
         ylabel="Price ($)"
     )
     
-    save_figure(fig, "01_time_series_forecast", OUTPUT_DIR)
+    save_figure(fig, "01_time_series_forecast", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: 01_time_series_forecast.png/pdf")
+    print(f"  Saved: 01_time_series_forecast.{SAVE_SUFFIX}")
 
 
 def demo_heatmap():
     """Demo 2: Correlation Heatmap"""
     print("Generating: Correlation Heatmap...")
     
-    use_mcm_style()
-    
-    # Generate sample correlation matrix
-    np.random.seed(42)
-    n_vars = 8
-    data = np.random.randn(100, n_vars)
+    # Sample correlation matrix
+    fixtures = make_fixtures()
+    data = fixtures['normal100x8'].copy()
+    noise = fixtures['noise100x2']
+    n_vars = data.shape[1]
     # Add some correlations
-    data[:, 1] = data[:, 0] * 0.8 + np.random.randn(100) * 0.4
-    data[:, 3] = data[:, 2] * -0.6 + np.random.randn(100) * 0.5
+    data[:, 1] = data[:, 0] * 0.8 + noise[:, 0] * 0.4
+    data[:, 3] = data[:, 2] * -0.6 + noise[:, 1] * 0.5
     
-    corr_matrix = np.corrcoef(data.T)
+    corr_matrix = fast_corrcoef(data)
     labels = [f"Var_{i+1}" for i in range(n_vars)]
     
     fig, ax = plot_correlation_matrix(
@@ -118,17 +183,16 @@ def demo_heatmap():
         title="Variable Correlation Analysis"
     )
     
-    save_figure(fig, "02_correlation_heatmap", OUTPUT_DIR)
+    save_figure(fig, "02_correlation_heatmap", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: 02_correlation_heatmap.png/pdf")
+    print(f"  Saved: 02_correlation_heatmap.{SAVE_SUFFIX}")
 
 
 def demo_phase_portrait():
     """Demo 3: Phase Portrait for Dynamic Systems"""
     print("Generating: Phase Portrait...")
     
-    use_mcm_style()
-    
     # Lotka-Volterra predator-prey model
     # dx/dt = alpha*x - beta*x*y
     # dy/dt = delta*x*y - gamma*y
@@ -151,47 +215,45 @@ def demo_phase_portrait():
         density=1.5
     )
     
-    save_figure(fig, "03_phase_portrait", OUTPUT_DIR)
+    save_figure(fig, "03_phase_portrait", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: 03_phase_portrait.png/pdf")
+    print(f"  Saved: 03_phase_portrait.{SAVE_SUFFIX}")
 
 
 def demo_network():
     """Demo 4: Network Topology"""
     print("Generating: Network Graph...")
     
-    use_mcm_style()
-    
     # Create sample network
     import networkx as nx
     
     G = nx.karate_club_graph()
+    # Seeded layout, so the figure is the same on every run
+    pos = nx.spring_layout(G, k=0.15, iterations=20, seed=42)
     
     fig, ax = plot_network_topology(
         G=G,
+        pos=pos,
         title="Social Network Structure",
         layout_algorithm='spring'
     )
     
-    save_figure(fig, "04_network_graph", OUTPUT_DIR)
+    save_figure(fig, "04_network_graph", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: 04_network_graph.png/pdf")
+    print(f"  Saved: 04_network_graph.{SAVE_SUFFIX}")
 
 
 def demo_pareto():
     """Demo 5: Pareto Frontier"""
     print("Generating: Pareto Frontier...")
     
-    use_mcm_style()
-    
-    # Generate sample multi-objective data
-    np.random.seed(42)
-    n_points = 50
+    # Sample multi-objective data
+    cost, noise = make_fixtures()['pareto50']
     
-    # Create Pareto-like distribution
-    cost = np.random.uniform(10, 100, n_points)
     # Risk inversely related to cost with noise
-    risk = 100 - 0.7 * cost + np.random.randn(n_points) * 10
+    risk = 100 - 0.7 * cost + noise * 10
     risk = np.clip(risk, 5, 95)
     
     fig, ax = plot_pareto_frontier(
@@ -204,17 +266,16 @@ def demo_pareto():
         minimize_y=True
     )
     
-    save_figure(fig, "05_pareto_frontier", OUTPUT_DIR)
+    save_figure(fig, "05_pareto_frontier", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: 05_pareto_frontier.png/pdf")
+    print(f"  Saved: 05_pareto_frontier.{SAVE_SUFFIX}")
 
 
 def demo_tornado():
     """Demo 6: Sensitivity Tornado Diagram"""
     print("Generating: Tornado Diagram...")
     
-    use_mcm_style()
-    
     # Sample sensitivity data
     param_names = [
         "Interest Rate",
@@ -238,32 +299,32 @@ def demo_tornado():
         xlabel="Net Present Value ($M)"
     )
     
-    save_figure(fig, "06_tornado_diagram", OUTPUT_DIR)
+    save_figure(fig, "06_tornado_diagram", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: 06_tornado_diagram.png/pdf")
+    print(f"  Saved: 06_tornado_diagram.{SAVE_SUFFIX}")
 
 
 def demo_multi_panel():
     """Demo 7: Multi-Panel Layout"""
     print("Generating: Multi-Panel Figure...")
     
-    use_mcm_style()
-    
     # Create 2x2 grid layout
     fig, axes = create_grid_layout(
         nrows=2,
         ncols=2,
-        suptitle="Data Analysis Pipeline"
+        suptitle="Data Analysis Pipeline",
+        constrained_layout=True
     )
     
     # Plot sample data in each panel
-    np.random.seed(42)
-    x = np.linspace(0, 10, 100)
+    # Scatter panels use marker-only Line2D artists: one batched marker
+    # draw per panel instead of a per-point PathCollection
+    marker_style = dict(linestyle='none', marker='o', markersize=3, markeredgewidth=0)
+    x, y_raw = make_fixtures()['sine100']
     
     # Panel (a): Raw data
-    y_raw = np.sin(x) + np.random.randn(100) * 0.3
-    axes[0, 0].scatter(x, y_raw, alpha=0.5, c=COLORS['blue'], s=10)
-    axes[0, 0].set_xlabel("Time")
+    axes[0, 0].plot(x, y_raw, color=COLORS['blue'], alpha=0.5, **marker_style)
     axes[0, 0].set_ylabel("Signal")
     axes[0, 0].set_title("Raw Data")
     
@@ -276,11 +337,14 @@ def demo_multi_panel():
     axes[0, 1].set_title("Processed")
     
     # Panel (c): Model fit
-    axes[1, 0].scatter(x, y_raw, alpha=0.3, c=COLORS['gray'], s=10, label='Data')
+    axes[1, 0].plot(x, y_raw, color=COLORS['gray'], alpha=0.3, label='Data', **marker_style)
     axes[1, 0].plot(x, np.sin(x), color=COLORS['vermilion'], linewidth=2, label='Model')
     axes[1, 0].set_xlabel("Time")
     axes[1, 0].set_ylabel("Signal")
     axes[1, 0].set_title("Model Fit")
+    # (a) and (c) plot the same time axis: share it and label it once
+    axes[0, 0].sharex(axes[1, 0])
+    axes[0, 0].tick_params(labelbottom=False)
     axes[1, 0].legend()
     
     # Panel (d): Residuals
@@ -291,20 +355,38 @@ def demo_multi_panel():
     axes[1, 1].set_ylabel("Frequency")
     axes[1, 1].set_title("Residuals")
     
-    plt.tight_layout()
-    save_figure(fig, "07_multi_panel", OUTPUT_DIR)
+    save_figure(fig, "07_multi_panel", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: 07_multi_panel.png/pdf")
+    print(f"  Saved: 07_multi_panel.{SAVE_SUFFIX}")
+
+
+def _run_demo(demo_func: Callable[[], None]) -> Optional[str]:
+    """
+    Runs one demo, inline or inside a worker process.
+    
+    Returns:
+        Error message if the demo failed, otherwise None
+    """
+    try:
+        demo_func()
+        return None
+    except Exception as e:
+        return str(e)
 
 
 def main():
-    """Run all demos."""
+    """Run all demos, in parallel worker processes when several CPUs exist."""
     print("=" * 60)
     print("MCM Visualization Demo: Generating All Plot Types")
     print("=" * 60)
     print(f"Output directory: {OUTPUT_DIR}")
     print()
     
+    # Apply the MCM style once for every demo below
+    use_mcm_style()
+    make_fixtures()
+    
     demos = [
         demo_time_series,
         demo_heatmap,
@@ -315,13 +397,22 @@ def main():
         demo_multi_panel,
     ]
     
+    # Demos are independent (own figure, own output file), so run them in
+    # separate processes; matplotlib state is not thread-safe. With a
+    # single CPU, worker startup would only add cost, so run them inline.
+    max_workers = min(len(demos), os.cpu_count() or 1)
+    if max_workers <= 1:
+        errors = [_run_demo(demo_func) for demo_func in demos]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            errors = list(executor.map(_run_demo, demos))
+    
     success_count = 0
-    for demo_func in demos:
-        try:
-            demo_func()
+    for demo_func, error in zip(demos, errors):
+        if error is None:
             success_count += 1
-        except Exception as e:
-            print(f"  Error in {demo_func.__name__}: {e}")
+        else:
+            print(f"  Error in {demo_func.__name__}: {error}")
     
     print()
     print("=" * 60)
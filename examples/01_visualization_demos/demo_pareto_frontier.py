@@ -5,7 +5,7 @@ MCM Visualization Demo: Pareto Frontier
 
 Detailed demonstration of multi-objective optimization visualizations:
 - 2D Pareto frontier
-- 3D scatter for 3 objectives
+- 3-objective scatter (2D projection, color-coded third objective)
 - Parallel coordinates for many objectives
 
 Usage:
@@ -21,7 +21,9 @@ sys.path.insert(0, str(skill_root))
 import numpy as np
 import matplotlib.pyplot as plt
 
-from templates.visualization import use_mcm_style, COLORS, save_figure
+from templates.visualization import (
+    use_mcm_style, COLORS, save_figure, get_save_formats, PREVIEW_PNG_COMPRESS_LEVEL,
+)
 from templates.visualization.plot_templates import (
     plot_pareto_frontier,
     plot_pareto_3d,
@@ -32,19 +34,21 @@ from templates.visualization.plot_templates import (
 OUTPUT_DIR = Path(__file__).parent / "sample_outputs"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+SAVE_FORMATS = get_save_formats()
+SAVE_SUFFIX = "/".join(SAVE_FORMATS)
+
 
 def demo_2d_pareto():
     """2D Pareto Frontier with dominated and non-dominated points."""
     print("Generating: 2D Pareto Frontier...")
-    use_mcm_style()
     
-    np.random.seed(123)
+    rng = np.random.default_rng(123)
     n = 100
     
     # Generate points: cost vs delivery time trade-off
-    cost = np.random.uniform(50, 200, n)
+    cost = rng.uniform(50, 200, n)
     # Inverse relationship with noise
-    time = 300 / cost + np.random.randn(n) * 3
+    time = 300 / cost + rng.normal(0, 3, n)
     time = np.clip(time, 1, 10)
     
     # Use actual function signature:
@@ -64,29 +68,29 @@ def demo_2d_pareto():
         connect_pareto=True
     )
     
-    save_figure(fig, "pareto_2d_cost_time", OUTPUT_DIR)
+    save_figure(fig, "pareto_2d_cost_time", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: pareto_2d_cost_time.png/pdf")
+    print(f"  Saved: pareto_2d_cost_time.{SAVE_SUFFIX}")
 
 
 def demo_3d_pareto():
-    """3D Pareto visualization for 3 objectives."""
-    print("Generating: 3D Pareto Scatter...")
-    use_mcm_style()
+    """3-objective Pareto visualization (x-y projection, color = z)."""
+    print("Generating: 3-Objective Pareto Scatter...")
     
-    np.random.seed(456)
+    rng = np.random.default_rng(456)
     n = 200
     
     # Three objectives: cost, risk, time
-    cost = np.random.uniform(10, 100, n)
-    risk = 50 - 0.3 * cost + np.random.randn(n) * 10
-    time = 20 + 0.1 * cost - 0.2 * risk + np.random.randn(n) * 3
+    cost = rng.uniform(10, 100, n)
+    risk = 50 - 0.3 * cost + rng.normal(0, 10, n)
+    time = 20 + 0.1 * cost - 0.2 * risk + rng.normal(0, 3, n)
     
     risk = np.clip(risk, 5, 60)
     time = np.clip(time, 5, 30)
     
     # Use actual function signature:
-    # plot_pareto_3d(x, y, z, title, xlabel, ylabel, zlabel, save_path=None)
+    # plot_pareto_3d(x, y, z, title, xlabel, ylabel, zlabel, save_path=None, mode="3d")
     fig, ax = plot_pareto_3d(
         x=cost,
         y=risk,
@@ -94,27 +98,28 @@ def demo_3d_pareto():
         xlabel="Cost ($1000)",
         ylabel="Risk Score",
         zlabel="Time (weeks)",
-        title="3-Objective Optimization"
+        title="3-Objective Optimization",
+        mode="projected"
     )
     
-    save_figure(fig, "pareto_3d_scatter", OUTPUT_DIR)
+    save_figure(fig, "pareto_3d_scatter", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: pareto_3d_scatter.png/pdf")
+    print(f"  Saved: pareto_3d_scatter.{SAVE_SUFFIX}")
 
 
 def demo_parallel_coordinates():
     """Parallel coordinates for multi-dimensional Pareto analysis."""
     print("Generating: Parallel Coordinates...")
-    use_mcm_style()
     
-    np.random.seed(789)
+    rng = np.random.default_rng(789)
     n = 50
     
     # 5 objectives
-    data = np.random.rand(n, 5)
+    data = rng.random((n, 5))
     # Add some structure
-    data[:, 1] = 1 - data[:, 0] + np.random.randn(n) * 0.1  # Inverse
-    data[:, 2] = data[:, 0] * 0.5 + np.random.randn(n) * 0.1  # Correlated
+    data[:, 1] = 1 - data[:, 0] + rng.normal(0, 0.1, n)  # Inverse
+    data[:, 2] = data[:, 0] * 0.5 + rng.normal(0, 0.1, n)  # Correlated
     data = np.clip(data, 0, 1)
     
     # Note: identify_pareto_front only works for 2D, so we manually create a mask
@@ -134,9 +139,10 @@ def demo_parallel_coordinates():
         title="Multi-Objective Comparison"
     )
     
-    save_figure(fig, "pareto_parallel_coords", OUTPUT_DIR)
+    save_figure(fig, "pareto_parallel_coords", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: pareto_parallel_coords.png/pdf")
+    print(f"  Saved: pareto_parallel_coords.{SAVE_SUFFIX}")
 
 
 def main():
@@ -146,6 +152,9 @@ def main():
     print(f"Output directory: {OUTPUT_DIR}")
     print()
     
+    # Apply the MCM style once for every demo below
+    use_mcm_style()
+    
     demo_2d_pareto()
     demo_3d_pareto()
     demo_parallel_coordinates()
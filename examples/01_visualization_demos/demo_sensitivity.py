@@ -21,7 +21,9 @@ sys.path.insert(0, str(skill_root))
 import numpy as np
 import matplotlib.pyplot as plt
 
-from templates.visualization import use_mcm_style, COLORS, save_figure
+from templates.visualization import (
+    use_mcm_style, COLORS, save_figure, get_save_formats, PREVIEW_PNG_COMPRESS_LEVEL,
+)
 from templates.visualization.plot_templates import (
     plot_tornado,
     plot_sensitivity_spider,
@@ -32,11 +34,13 @@ from templates.visualization.plot_templates import (
 OUTPUT_DIR = Path(__file__).parent / "sample_outputs"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+SAVE_FORMATS = get_save_formats()
+SAVE_SUFFIX = "/".join(SAVE_FORMATS)
+
 
 def demo_tornado():
     """Tornado diagram showing parameter importance."""
     print("Generating: Tornado Diagram...")
-    use_mcm_style()
     
     # Economic model sensitivity parameters
     param_names = [
@@ -70,15 +74,15 @@ def demo_tornado():
         perturbation_label="±20%"
     )
     
-    save_figure(fig, "sensitivity_tornado", OUTPUT_DIR)
+    save_figure(fig, "sensitivity_tornado", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: sensitivity_tornado.png/pdf")
+    print(f"  Saved: sensitivity_tornado.{SAVE_SUFFIX}")
 
 
 def demo_spider():
     """Spider plot showing sensitivity curves."""
     print("Generating: Spider Plot...")
-    use_mcm_style()
     
     # Define parameter names
     param_names = ["Interest Rate", "Material Cost", "Labor Cost", "Demand", "Price"]
@@ -87,22 +91,16 @@ def demo_spider():
     baseline_params = np.array([0.05, 100, 50, 1000, 25])
     baseline_output = 500  # Baseline profit
     
-    # Define test ranges for each parameter (80% to 120% of baseline)
-    param_values = []
-    output_values = []
-    
     # Sensitivities (output change per unit param change)
-    sensitivities = [-0.8, -0.5, -0.3, 0.6, 0.9]
-    
-    for i, (base_val, sens) in enumerate(zip(baseline_params, sensitivities)):
-        # Test from 80% to 120% of baseline
-        test_vals = np.linspace(base_val * 0.8, base_val * 1.2, 9)
-        # Calculate output: baseline + sensitivity * (param_change_fraction * 100)
-        param_change_pct = (test_vals - base_val) / base_val * 100
-        outputs = baseline_output + sens * param_change_pct * 5  # Scale factor
-        
-        param_values.append(test_vals)
-        output_values.append(outputs)
+    sensitivities = np.array([-0.8, -0.5, -0.3, 0.6, 0.9])
+    
+    # Test every parameter from 80% to 120% of baseline in one broadcast:
+    # rows are parameters, columns are the 9 test points
+    frac = np.linspace(0.8, 1.2, 9)
+    param_values = baseline_params[:, None] * frac
+    # Output: baseline + sensitivity * (param_change_fraction * 100)
+    param_change_pct = (frac - 1) * 100
+    output_values = baseline_output + sensitivities[:, None] * param_change_pct * 5  # Scale factor
     
     # Use actual function signature:
     # plot_sensitivity_spider(param_names, param_values, output_values,
@@ -119,25 +117,26 @@ def demo_spider():
         ylabel="Profit ($1000)"
     )
     
-    save_figure(fig, "sensitivity_spider", OUTPUT_DIR)
+    save_figure(fig, "sensitivity_spider", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: sensitivity_spider.png/pdf")
+    print(f"  Saved: sensitivity_spider.{SAVE_SUFFIX}")
 
 
 def demo_heatmap():
     """Sensitivity heatmap for two-parameter interaction."""
     print("Generating: Sensitivity Heatmap...")
-    use_mcm_style()
     
     # Two parameters: Interest Rate and Demand Growth
     interest_rates = np.linspace(0.02, 0.10, 9)  # 2% to 10%
     demand_growth = np.linspace(-0.05, 0.15, 11)  # -5% to 15%
     
-    # Create output matrix (NPV in $M)
-    IR, DG = np.meshgrid(interest_rates, demand_growth)
-    # NPV decreases with interest rate, increases with demand
-    np.random.seed(42)
-    NPV = 10 - 50 * IR + 30 * DG + 0.5 * np.random.randn(*IR.shape)
+    # Create output matrix (NPV in $M): rows follow demand growth, columns
+    # follow interest rate. NPV decreases with interest rate, increases with
+    # demand; the two 1-D terms broadcast without building meshgrid copies
+    rng = np.random.default_rng(42)
+    NPV = (10 - 50 * interest_rates)[None, :] + (30 * demand_growth)[:, None]
+    NPV += rng.normal(0, 0.5, NPV.shape)
     
     # Use actual function signature:
     # plot_sensitivity_heatmap(param1_name, param2_name, param1_values, param2_values,
@@ -152,9 +151,10 @@ def demo_heatmap():
         output_label="NPV ($M)"
     )
     
-    save_figure(fig, "sensitivity_heatmap", OUTPUT_DIR)
+    save_figure(fig, "sensitivity_heatmap", OUTPUT_DIR, formats=SAVE_FORMATS,
+                png_compress_level=PREVIEW_PNG_COMPRESS_LEVEL)
     plt.close(fig)
-    print("  Saved: sensitivity_heatmap.png/pdf")
+    print(f"  Saved: sensitivity_heatmap.{SAVE_SUFFIX}")
 
 
 def demo_summary_table():
@@ -192,6 +192,9 @@ def main():
     print(f"Output directory: {OUTPUT_DIR}")
     print()
     
+    # Apply the MCM style once for every demo below
+    use_mcm_style()
+    
     demo_tornado()
     demo_spider()
     demo_heatmap()
@@ -3,21 +3,26 @@ import subprocess
 import datetime
 import sys
 
-def run_command(command, cwd=None):
+def run_command(argv, cwd=None):
+    # argv is passed straight to the executable: no intermediate shell
+    # process, and no quoting issues with arguments such as commit messages
     try:
         result = subprocess.run(
-            command, 
+            argv, 
             cwd=cwd, 
             check=True, 
             text=True, 
-            capture_output=True,
-            shell=True  # Required for some git commands on Windows
+            capture_output=True
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
-        print(f"Error running command: {command}")
+        print(f"Error running command: {' '.join(argv)}")
         print(f"Error output: {e.stderr}")
         return None
+    except OSError as e:
+        print(f"Error running command: {' '.join(argv)}")
+        print(f"Error output: {e}")
+        return None
 
 def auto_evolve():
     # Define the skill directory (current script is in ./scripts/, so we go up one level)
@@ -26,7 +31,7 @@ def auto_evolve():
     print(f"Starting auto-evolution for: {skill_dir}")
     
     # 1. Check for changes
-    status = run_command("git status --porcelain", cwd=skill_dir)
+    status = run_command(["git", "status", "--porcelain"], cwd=skill_dir)
     
     if not status:
         print("No changes detected. Nothing to evolve.")
@@ -37,7 +42,7 @@ def auto_evolve():
     
     # 2. Stage all changes
     print("Staging changes...")
-    run_command("git add .", cwd=skill_dir)
+    run_command(["git", "add", "."], cwd=skill_dir)
     
     # 3. Create commit message
     today = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -48,11 +53,11 @@ def auto_evolve():
         commit_msg = f"feat(evolution): {sys.argv[1]} [{today}]"
         
     print(f"Committing with message: '{commit_msg}'")
-    run_command(f'git commit -m "{commit_msg}"', cwd=skill_dir)
+    run_command(["git", "commit", "-m", commit_msg], cwd=skill_dir)
     
     # 4. Push to remote
     print("Pushing to origin/main...")
-    push_result = run_command("git push origin main", cwd=skill_dir)
+    push_result = run_command(["git", "push", "origin", "main"], cwd=skill_dir)
     
     if push_result is not None:
         print("Evolution complete! Changes pushed to GitHub.")
@@ -9,33 +9,111 @@ Usage:
     python check_format.py paper.pdf
     python check_format.py paper.pdf --verbose
     python check_format.py paper.pdf --output report.txt
+    python check_format.py paper.pdf --cache
+    python check_format.py papers/*.pdf --output-dir reports/
 
 Requirements:
     pip install pypdf
+    pip install pymupdf   (optional, much faster text extraction)
 """
 
 import argparse
+import hashlib
+import os
+import pickle
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
 from pathlib import Path
+from typing import List, Tuple, Union
 
+# PyMuPDF's C text extractor is preferred when available; pypdf/PyPDF2
+# remain the pure-Python fallback
 try:
-    from pypdf import PdfReader
+    import pymupdf
 except ImportError:
     try:
-        from PyPDF2 import PdfReader
+        import fitz as pymupdf  # PyMuPDF < 1.24
     except ImportError:
-        print("Error: Please install pypdf or PyPDF2")
-        print("  pip install pypdf")
-        print("  or")
-        print("  pip install PyPDF2")
-        sys.exit(1)
+        pymupdf = None
+
+PdfReader = None
+if pymupdf is None:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        try:
+            from PyPDF2 import PdfReader
+        except ImportError:
+            print("Error: Please install pypdf or PyPDF2")
+            print("  pip install pypdf")
+            print("  or")
+            print("  pip install PyPDF2")
+            sys.exit(1)
+
+
+# Extracted page text is cached here when --cache is given
+CACHE_DIR = Path.home() / ".cache" / "mcm-checker"
+
+# Minimum pages per worker before pypdf extraction is split across
+# processes; below this, worker startup costs more than it saves
+PARALLEL_CHUNK_PAGES = 16
+
+
+def _compile_lower(pattern: str) -> re.Pattern:
+    """
+    Compile a pattern for matching against lower-cased text.
+    
+    Letters are lower-cased except in escapes, so classes such as \\d, \\s
+    or \\S keep their meaning. Matching pre-lowered text with a plain pattern
+    is several times faster than re.IGNORECASE on every search.
+    """
+    return re.compile(re.sub(
+        r"\\.|[^\\]+",
+        lambda m: m.group() if m.group().startswith("\\") else m.group().lower(),
+        pattern
+    ))
+
+
+def _compile_matcher(pattern: str) -> Union[str, re.Pattern]:
+    """
+    Prepare a pattern for _find_patterns: plain literals (no regex
+    metacharacters) become lower-cased strings tested with 'in', which
+    skips the regex engine; anything else goes through _compile_lower.
+    """
+    if re.escape(pattern) == pattern:
+        return pattern.lower()
+    return _compile_lower(pattern)
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract text of pages [start, stop) with pypdf in a worker process."""
+    reader = PdfReader(pdf_path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
 
 
 # =============================================================================
 # Check Functions
 # =============================================================================
 
+# Result statuses in summary order, and their report icons
+STATUSES = ("PASS", "WARN", "FAIL", "ERROR")
+STATUS_ICONS = ("[PASS]", "[WARN]", "[FAIL]", "[ERR!]")
+_STATUS_INDEX = {status: i for i, status in enumerate(STATUSES)}
+_STATUS_ICON = dict(zip(STATUSES, STATUS_ICONS))
+
+
+class Category(IntEnum):
+    """Report sections, in the order they are printed."""
+    FILE = 0
+    PAGES = 1
+    HEADER = 2
+    ANONYMOUS = 3
+    STRUCTURE = 4
+
+
 class FormatChecker:
     """MCM/ICM paper format checker."""
     
@@ -70,62 +148,229 @@ class FormatChecker:
         r"written\s+by",
     ]
     
-    def __init__(self, pdf_path: str, verbose: bool = False):
+    # Structural section headings
+    REFERENCE_PATTERNS = [
+        r"\bReferences\b",
+        r"\bBibliography\b",
+        r"\bWorks\s+Cited\b",
+    ]
+    SUMMARY_PATTERNS = [
+        r"\bSummary\b",
+        r"\bAbstract\b",
+        r"\bExecutive\s+Summary\b",
+    ]
+    KEYWORDS_PATTERN = r"\bKeywords?\s*:"
+    
+    # Lower-case words every match of the heading patterns above must
+    # contain; pages without any of them skip the \b regex (which has no
+    # literal prefix to speed it up) via a plain substring test
+    REFERENCE_HINTS = ("references", "bibliography", "cited")
+    SUMMARY_HINTS = ("summary", "abstract")
+    KEYWORDS_HINTS = ("keyword",)
+    
+    # Compiled once at class creation and shared by every checker instance.
+    # All checks are case-insensitive: patterns are lower-cased here and run
+    # against lower_content, which is lower-cased once per document
+    _TEAM_NUMBER_RE = _compile_lower(TEAM_NUMBER_PATTERN)
+    _PAGE_HEADER_RE = _compile_lower(PAGE_HEADER_PATTERN)
+    # Kept as separate patterns: CPython's backtracking re engine tries
+    # every branch of an alternation at each position, while a lone pattern
+    # with a literal prefix uses a fast substring search (and pure literals
+    # skip the regex engine entirely)
+    _SCHOOL_RES = [_compile_matcher(p) for p in SCHOOL_PATTERNS]
+    _NAME_RES = [_compile_matcher(p) for p in NAME_INDICATORS]
+    # Checks that only need a yes/no answer use one alternation per list,
+    # so each page is scanned once instead of once per heading
+    _REFERENCE_RE = _compile_lower("|".join(f"(?:{p})" for p in REFERENCE_PATTERNS))
+    _SUMMARY_RE = _compile_lower("|".join(f"(?:{p})" for p in SUMMARY_PATTERNS))
+    _KEYWORDS_RE = _compile_lower(KEYWORDS_PATTERN)
+    
+    def __init__(
+        self,
+        pdf_path: str,
+        verbose: bool = False,
+        use_cache: bool = False,
+        parallel_extract: bool = True
+    ):
         self.pdf_path = Path(pdf_path)
         self.verbose = verbose
+        self.use_cache = use_cache
+        # Batch mode already runs one checker per process; nested pools
+        # would only oversubscribe the cores
+        self.parallel_extract = parallel_extract
         self.results = []
+        # Same result dicts as self.results, bucketed by Category value
+        self.results_by_category = [[] for _ in Category]
+        # Running totals per status, indexed like STATUSES
+        self.status_counts = [0] * len(STATUSES)
         self.text_content = []
+        self._lower_content = None
         self.reader = None
+        self.page_count = None
         
     def load_pdf(self) -> bool:
         """Load the PDF file."""
         if not self.pdf_path.exists():
-            self._add_result("ERROR", "FILE", f"File not found: {self.pdf_path}")
+            self._add_result("ERROR", Category.FILE, f"File not found: {self.pdf_path}")
             return False
         
         if not self.pdf_path.suffix.lower() == ".pdf":
-            self._add_result("ERROR", "FILE", "File is not a PDF")
+            self._add_result("ERROR", Category.FILE, "File is not a PDF")
             return False
         
+        if self.use_cache and self._read_cache():
+            self._add_result(
+                "PASS",
+                Category.FILE,
+                f"Successfully loaded: {self.pdf_path.name}",
+                "Page text read from cache"
+            )
+            return True
+        
         try:
-            self.reader = PdfReader(str(self.pdf_path))
+            if pymupdf is not None:
+                with pymupdf.open(str(self.pdf_path)) as doc:
+                    self.page_count = doc.page_count
+                    self.text_content = [page.get_text("text") for page in doc]
+            else:
+                self.reader = PdfReader(str(self.pdf_path))
+                self.page_count = len(self.reader.pages)
+                
+                # pypdf is pure Python: spread long documents over processes
+                workers = min(os.cpu_count() or 1, self.page_count // PARALLEL_CHUNK_PAGES)
+                if self.parallel_extract and workers > 1:
+                    self.text_content = self._extract_parallel(workers)
+                else:
+                    # Extract text from all pages
+                    for page in self.reader.pages:
+                        text = page.extract_text() or ""
+                        self.text_content.append(text)
             
-            # Extract text from all pages
-            for page in self.reader.pages:
-                text = page.extract_text() or ""
-                self.text_content.append(text)
+            if self.use_cache:
+                self._write_cache()
             
-            self._add_result("PASS", "FILE", f"Successfully loaded: {self.pdf_path.name}")
+            self._add_result("PASS", Category.FILE, f"Successfully loaded: {self.pdf_path.name}")
             return True
             
         except Exception as e:
-            self._add_result("ERROR", "FILE", f"Failed to read PDF: {str(e)}")
+            self._add_result("ERROR", Category.FILE, f"Failed to read PDF: {str(e)}")
+            return False
+    
+    @property
+    def lower_content(self) -> List[str]:
+        """Lower-cased page text, computed once and shared by all checks."""
+        if self._lower_content is None:
+            self._lower_content = [text.lower() for text in self.text_content]
+        return self._lower_content
+    
+    def _extract_parallel(self, workers: int) -> List[str]:
+        """Extract page text with pypdf in contiguous page ranges, one per worker."""
+        bounds = [i * self.page_count // workers for i in range(workers + 1)]
+        path = str(self.pdf_path)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                _extract_page_range, [path] * workers, bounds[:-1], bounds[1:]
+            )
+            return [text for chunk in chunks for text in chunk]
+    
+    def _cache_path(self) -> Path:
+        """
+        Cache file for this PDF, keyed by path, modification time, size and
+        extraction backend, so any edit to the file invalidates the entry.
+        """
+        stat = self.pdf_path.stat()
+        backend = "pymupdf" if pymupdf is not None else "pypdf"
+        key = hashlib.blake2b(
+            f"{self.pdf_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{backend}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return CACHE_DIR / f"{key}.pkl"
+    
+    def _read_cache(self) -> bool:
+        """Load cached page text; returns False on a miss or unreadable entry."""
+        try:
+            with open(self._cache_path(), "rb") as f:
+                self.page_count, self.text_content = pickle.load(f)
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable cache entry: {e}")
             return False
     
-    def _add_result(self, status: str, category: str, message: str, details: str = None):
+    def _write_cache(self):
+        """Store extracted page text; failures only cost the cache."""
+        try:
+            cache_path = self._cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump((self.page_count, self.text_content), f)
+        except OSError as e:
+            print(f"Warning: Could not write text cache: {e}")
+    
+    def _add_result(self, status: str, category: Category, message: str, details: str = None):
         """Add a check result."""
-        self.results.append({
+        result = {
             "status": status,
-            "category": category,
+            "category": category.name,
             "message": message,
             "details": details
-        })
+        }
+        self.results.append(result)
+        self.results_by_category[category].append(result)
+        self.status_counts[_STATUS_INDEX[status]] += 1
+    
+    @staticmethod
+    def _find_patterns(
+        matchers: List[Union[str, re.Pattern]],
+        patterns: List[str],
+        pages: List[str]
+    ) -> List[str]:
+        """
+        Scan pages in order for each pattern, page by page.
+        
+        A pattern is not searched again once it has matched, and the scan
+        stops as soon as every pattern has matched.
+        
+        Returns:
+            The patterns that matched on any page, in their original order
+        """
+        found = [False] * len(matchers)
+        
+        for text in pages:
+            for i, matcher in enumerate(matchers):
+                if found[i]:
+                    continue
+                if isinstance(matcher, str):
+                    found[i] = matcher in text
+                else:
+                    found[i] = matcher.search(text) is not None
+            if all(found):
+                break
+        
+        return [pattern for pattern, hit in zip(patterns, found) if hit]
+    
+    @staticmethod
+    def _has_heading(text: str, hints: Tuple[str, ...], regex: re.Pattern) -> bool:
+        """Run regex on lower-cased text only if one of its hint words occurs."""
+        return any(hint in text for hint in hints) and regex.search(text) is not None
     
     def check_page_count(self):
         """Check if page count is within limit."""
-        page_count = len(self.reader.pages)
+        page_count = self.page_count
         
         if page_count <= self.MAX_PAGES:
             self._add_result(
                 "PASS", 
-                "PAGES", 
+                Category.PAGES, 
                 f"Page count: {page_count}/{self.MAX_PAGES}",
                 f"{self.MAX_PAGES - page_count} pages remaining"
             )
         else:
             self._add_result(
                 "FAIL",
-                "PAGES",
+                Category.PAGES,
                 f"Page count: {page_count}/{self.MAX_PAGES}",
                 f"OVER LIMIT by {page_count - self.MAX_PAGES} pages!"
             )
@@ -135,8 +380,8 @@ class FormatChecker:
         team_found = False
         team_pages = []
         
-        for i, text in enumerate(self.text_content, 1):
-            if re.search(self.TEAM_NUMBER_PATTERN, text, re.IGNORECASE):
+        for i, text in enumerate(self.lower_content, 1):
+            if self._TEAM_NUMBER_RE.search(text):
                 team_found = True
                 team_pages.append(i)
         
@@ -144,20 +389,20 @@ class FormatChecker:
             if len(team_pages) == len(self.text_content):
                 self._add_result(
                     "PASS",
-                    "HEADER",
+                    Category.HEADER,
                     "Team number header found on all pages"
                 )
             else:
                 self._add_result(
                     "WARN",
-                    "HEADER",
+                    Category.HEADER,
                     f"Team number found on {len(team_pages)}/{len(self.text_content)} pages",
                     f"Found on pages: {team_pages[:5]}{'...' if len(team_pages) > 5 else ''}"
                 )
         else:
             self._add_result(
                 "FAIL",
-                "HEADER",
+                Category.HEADER,
                 "No team number header found (Team # XXXXXXX)",
                 "Ensure 'Team # XXXXXXX' appears in header with your 7-digit number"
             )
@@ -167,8 +412,8 @@ class FormatChecker:
         page_header_found = False
         pages_with_header = []
         
-        for i, text in enumerate(self.text_content, 1):
-            if re.search(self.PAGE_HEADER_PATTERN, text, re.IGNORECASE):
+        for i, text in enumerate(self.lower_content, 1):
+            if self._PAGE_HEADER_RE.search(text):
                 page_header_found = True
                 pages_with_header.append(i)
         
@@ -177,93 +422,82 @@ class FormatChecker:
             if coverage >= 0.8:
                 self._add_result(
                     "PASS",
-                    "HEADER",
+                    Category.HEADER,
                     f"Page headers present (Page X of Y)"
                 )
             else:
                 self._add_result(
                     "WARN",
-                    "HEADER",
+                    Category.HEADER,
                     f"Page headers found on {len(pages_with_header)}/{len(self.text_content)} pages"
                 )
         else:
             self._add_result(
                 "WARN",
-                "HEADER",
+                Category.HEADER,
                 "Page number headers not detected (Page X of Y)",
                 "Consider adding 'Page X of Y' headers"
             )
     
     def check_identifying_info(self):
         """Check for potentially identifying information."""
-        full_text = " ".join(self.text_content).lower()
-        
         # Check for school/university names
-        school_matches = []
-        for pattern in self.SCHOOL_PATTERNS:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                school_matches.append(pattern)
+        school_matches = self._find_patterns(
+            self._SCHOOL_RES, self.SCHOOL_PATTERNS, self.lower_content
+        )
         
         if school_matches:
             self._add_result(
                 "WARN",
-                "ANONYMOUS",
+                Category.ANONYMOUS,
                 "Possible school/institution names detected",
                 f"Patterns found: {', '.join(school_matches[:3])}"
             )
         else:
             self._add_result(
                 "PASS",
-                "ANONYMOUS",
+                Category.ANONYMOUS,
                 "No obvious school/institution names detected"
             )
         
         # Check for name indicators
-        name_matches = []
-        for pattern in self.NAME_INDICATORS:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                name_matches.append(pattern)
+        name_matches = self._find_patterns(
+            self._NAME_RES, self.NAME_INDICATORS, self.lower_content
+        )
         
         if name_matches:
             self._add_result(
                 "FAIL",
-                "ANONYMOUS",
+                Category.ANONYMOUS,
                 "Possible author name indicators found",
                 f"Patterns: {', '.join(name_matches)}"
             )
         else:
             self._add_result(
                 "PASS",
-                "ANONYMOUS",
+                Category.ANONYMOUS,
                 "No obvious author name indicators detected"
             )
     
     def check_references(self):
         """Check for references section."""
-        full_text = " ".join(self.text_content)
-        
-        ref_patterns = [
-            r"\bReferences\b",
-            r"\bBibliography\b",
-            r"\bWorks\s+Cited\b",
-        ]
-        
-        ref_found = False
-        for pattern in ref_patterns:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                ref_found = True
-                break
+        # References usually sit near the end: scan from the last page back
+        # and stop at the first page mentioning any heading
+        ref_found = any(
+            self._has_heading(text, self.REFERENCE_HINTS, self._REFERENCE_RE)
+            for text in reversed(self.lower_content)
+        )
         
         if ref_found:
             self._add_result(
                 "PASS",
-                "STRUCTURE",
+                Category.STRUCTURE,
                 "References section detected"
             )
         else:
             self._add_result(
                 "WARN",
-                "STRUCTURE",
+                Category.STRUCTURE,
                 "No References section detected",
                 "Ensure you have a clearly labeled References section"
             )
@@ -271,48 +505,40 @@ class FormatChecker:
     def check_summary(self):
         """Check for summary/abstract section."""
         # Check first 2 pages for summary
-        first_pages = " ".join(self.text_content[:2]) if len(self.text_content) >= 2 else self.text_content[0]
-        
-        summary_patterns = [
-            r"\bSummary\b",
-            r"\bAbstract\b",
-            r"\bExecutive\s+Summary\b",
-        ]
-        
-        summary_found = False
-        for pattern in summary_patterns:
-            if re.search(pattern, first_pages, re.IGNORECASE):
-                summary_found = True
-                break
+        summary_found = any(
+            self._has_heading(text, self.SUMMARY_HINTS, self._SUMMARY_RE)
+            for text in self.lower_content[:2]
+        )
         
         if summary_found:
             self._add_result(
                 "PASS",
-                "STRUCTURE",
+                Category.STRUCTURE,
                 "Summary/Abstract section detected"
             )
         else:
             self._add_result(
                 "WARN",
-                "STRUCTURE",
+                Category.STRUCTURE,
                 "No Summary section detected on first pages",
                 "MCM requires a 1-page summary at the beginning"
             )
     
     def check_keywords(self):
         """Check for keywords."""
-        first_pages = " ".join(self.text_content[:2]) if len(self.text_content) >= 2 else self.text_content[0]
-        
-        if re.search(r"\bKeywords?\s*:", first_pages, re.IGNORECASE):
+        if any(
+            self._has_heading(text, self.KEYWORDS_HINTS, self._KEYWORDS_RE)
+            for text in self.lower_content[:2]
+        ):
             self._add_result(
                 "PASS",
-                "STRUCTURE",
+                Category.STRUCTURE,
                 "Keywords detected"
             )
         else:
             self._add_result(
                 "WARN",
-                "STRUCTURE",
+                Category.STRUCTURE,
                 "No Keywords section detected",
                 "Consider adding keywords after your summary"
             )
@@ -337,42 +563,26 @@ class FormatChecker:
         lines.append("MCM/ICM FORMAT CHECK REPORT")
         lines.append("=" * 60)
         lines.append(f"File: {self.pdf_path.name}")
-        lines.append(f"Pages: {len(self.reader.pages) if self.reader else 'N/A'}")
+        lines.append(f"Pages: {self.page_count if self.page_count is not None else 'N/A'}")
         lines.append("=" * 60)
         lines.append("")
         
-        # Group results by category
-        categories = {}
-        for result in self.results:
-            cat = result["category"]
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(result)
-        
-        # Status indicators
-        status_icons = {
-            "PASS": "[PASS]",
-            "FAIL": "[FAIL]",
-            "WARN": "[WARN]",
-            "ERROR": "[ERR!]",
-        }
-        
-        # Summary counts
-        counts = {"PASS": 0, "FAIL": 0, "WARN": 0, "ERROR": 0}
+        verbose = self.verbose
         
-        for category, results in categories.items():
-            lines.append(f"[{category}]")
+        for category in Category:
+            results = self.results_by_category[category]
+            if not results:
+                continue
+            
+            lines.append(f"[{category.name}]")
             lines.append("-" * 40)
             
             for result in results:
-                status = result["status"]
-                icon = status_icons.get(status, "[????]")
-                counts[status] = counts.get(status, 0) + 1
-                
-                lines.append(f"  {icon} {result['message']}")
+                lines.append(f"  {_STATUS_ICON[result['status']]} {result['message']}")
                 
-                if result.get("details") and self.verbose:
-                    lines.append(f"         -> {result['details']}")
+                details = result["details"]
+                if details and verbose:
+                    lines.append(f"         -> {details}")
             
             lines.append("")
         
@@ -380,16 +590,15 @@ class FormatChecker:
         lines.append("=" * 60)
         lines.append("SUMMARY")
         lines.append("=" * 60)
-        lines.append(f"  [PASS]: {counts['PASS']}")
-        lines.append(f"  [WARN]: {counts['WARN']}")
-        lines.append(f"  [FAIL]: {counts['FAIL']}")
-        lines.append(f"  [ERR!]: {counts['ERROR']}")
+        for icon, count in zip(STATUS_ICONS, self.status_counts):
+            lines.append(f"  {icon}: {count}")
         lines.append("")
         
         # Overall status
-        if counts["FAIL"] > 0 or counts["ERROR"] > 0:
+        n_pass, n_warn, n_fail, n_error = self.status_counts
+        if n_fail > 0 or n_error > 0:
             lines.append("STATUS: ISSUES FOUND - Please review and fix before submission")
-        elif counts["WARN"] > 0:
+        elif n_warn > 0:
             lines.append("STATUS: WARNINGS - Review recommended before submission")
         else:
             lines.append("STATUS: PASSED - Paper appears to meet format requirements")
@@ -403,6 +612,46 @@ class FormatChecker:
 # Main
 # =============================================================================
 
+def _run_one(
+    pdf_file: str, verbose: bool, use_cache: bool, parallel_extract: bool = False
+) -> str:
+    """
+    Check one PDF and return its report. An unexpected failure becomes an
+    ERROR result in that report, so one bad file cannot abort a batch.
+    """
+    checker = FormatChecker(
+        pdf_file, verbose=verbose, use_cache=use_cache, parallel_extract=parallel_extract
+    )
+    try:
+        checker.run_all_checks()
+    except Exception as e:
+        checker._add_result("ERROR", Category.FILE, f"Check failed: {e}")
+    return checker.generate_report()
+
+
+def _report_names(pdf_files: List[str]) -> List[str]:
+    """
+    File names for --output-dir reports: <stem>_format_report.txt, with a
+    numeric suffix for PDFs sharing a stem so no report overwrites another.
+    Names are compared case-insensitively for Windows/macOS filesystems.
+    """
+    stems = [Path(pdf_file).stem for pdf_file in pdf_files]
+    counts = Counter(stem.lower() for stem in stems)
+    used = {stem.lower() for stem in stems if counts[stem.lower()] == 1}
+    names = []
+    
+    for stem in stems:
+        if counts[stem.lower()] > 1:
+            n = 1
+            while f"{stem}_{n}".lower() in used:
+                n += 1
+            stem = f"{stem}_{n}"
+            used.add(stem.lower())
+        names.append(f"{stem}_format_report.txt")
+    
+    return names
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Check MCM/ICM paper format compliance",
@@ -412,6 +661,8 @@ Examples:
   python check_format.py paper.pdf
   python check_format.py paper.pdf --verbose
   python check_format.py paper.pdf --output report.txt
+  python check_format.py paper.pdf --cache
+  python check_format.py papers/*.pdf --output-dir reports/
 
 Checks performed:
   - Page count (max 25 pages)
@@ -430,7 +681,8 @@ Note: This is an automated check and may not catch all issues.
     parser.add_argument(
         "pdf_file",
         type=str,
-        help="Path to the PDF file to check"
+        nargs="+",
+        help="Path to the PDF file(s) to check"
     )
     
     parser.add_argument(
@@ -446,22 +698,61 @@ Note: This is an automated check and may not catch all issues.
         help="Save report to file (default: print to console)"
     )
     
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default=None,
+        help="Save one <name>_format_report.txt per PDF into this directory"
+    )
+    
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Cache extracted page text in {CACHE_DIR} for faster re-runs"
+    )
+    
     args = parser.parse_args()
     
-    # Run checks
-    checker = FormatChecker(args.pdf_file, verbose=args.verbose)
-    checker.run_all_checks()
+    if args.output and len(args.pdf_file) > 1:
+        parser.error("--output takes a single PDF; use --output-dir for several")
     
-    # Generate report
-    report = checker.generate_report()
+    # Run checks; several PDFs are spread over worker processes so module
+    # imports and interpreter startup are paid once per worker, not per file
+    n_files = len(args.pdf_file)
+    workers = min(n_files, os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = list(executor.map(
+                _run_one,
+                args.pdf_file,
+                [args.verbose] * n_files,
+                [args.cache] * n_files
+            ))
+    else:
+        reports = [
+            _run_one(pdf_file, args.verbose, args.cache, parallel_extract=True)
+            for pdf_file in args.pdf_file
+        ]
     
     # Output
     if args.output:
         output_path = Path(args.output)
-        output_path.write_text(report, encoding="utf-8")
+        output_path.write_text(reports[0], encoding="utf-8")
         print(f"Report saved to: {output_path}")
+    elif args.output_dir:
+        output_dir = Path(args.output_dir)
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            names = _report_names(args.pdf_file)
+            for pdf_file, name, report in zip(args.pdf_file, names, reports):
+                output_path = output_dir / name
+                output_path.write_text(report, encoding="utf-8")
+                print(f"Report for {pdf_file} saved to: {output_path}")
+        except OSError as e:
+            print(f"Error: Could not write reports to {output_dir}: {e}")
+            sys.exit(1)
     else:
-        print(report)
+        print("\n\n".join(reports))
 
 
 if __name__ == "__main__":
@@ -35,92 +35,100 @@ Creates:
 
 import argparse
 import os
+import shutil
 from pathlib import Path
 from datetime import datetime
+from string import Template
+from typing import Optional
+
+
+VALID_PROBLEMS = ("A", "B", "C", "D", "E", "F")
+# Accept lower-case letters too; main() normalises with .upper()
+_PROBLEM_CHOICES = VALID_PROBLEMS + tuple(p.lower() for p in VALID_PROBLEMS)
 
 
 # =============================================================================
 # LaTeX Templates
 # =============================================================================
 
-MAIN_TEX_TEMPLATE = r'''\documentclass[12pt]{{article}}
+MAIN_TEX_TEMPLATE = r'''\documentclass[12pt]{article}
 
 % ============================================================================
 % MCM/ICM Paper Template
 % Team Control Number: XXXXXXX (Replace with your team number)
-% Problem: {problem}
-% Year: {year}
+% Problem: $problem
+% Year: $year
 % ============================================================================
 
 % ----- Page Layout -----
-\usepackage[letterpaper, margin=1in]{{geometry}}
-\usepackage{{fancyhdr}}
+\usepackage[letterpaper, margin=1in]{geometry}
+\usepackage{fancyhdr}
 
 % ----- Math Packages -----
-\usepackage{{amsmath, amssymb, amsthm}}
-\usepackage{{mathtools}}
+\usepackage{amsmath, amssymb, amsthm}
+\usepackage{mathtools}
 
 % ----- Graphics and Tables -----
-\usepackage{{graphicx}}
-\usepackage{{float}}
-\usepackage{{booktabs}}
-\usepackage{{tabularx}}
-\usepackage{{multirow}}
-\usepackage{{subcaption}}
+\usepackage{graphicx}
+\usepackage{float}
+\usepackage{booktabs}
+\usepackage{tabularx}
+\usepackage{multirow}
+\usepackage{subcaption}
 
 % ----- Code and Algorithms -----
-\usepackage{{algorithm}}
-\usepackage{{algpseudocode}}
-\usepackage{{listings}}
+\usepackage{algorithm}
+\usepackage{algpseudocode}
+\usepackage{listings}
 
 % ----- References and Links -----
-\usepackage[hidelinks]{{hyperref}}
-\usepackage{{cite}}
-\usepackage{{url}}
+\usepackage[hidelinks]{hyperref}
+\usepackage{cite}
+\usepackage{url}
 
 % ----- Formatting -----
-\usepackage{{enumitem}}
-\usepackage{{setspace}}
-\usepackage{{xcolor}}
-\usepackage{{lipsum}}  % Remove after adding content
+\usepackage{enumitem}
+\usepackage{setspace}
+\usepackage{xcolor}
+\usepackage{lipsum}  % Remove after adding content
 
 % ----- Header/Footer Setup -----
-\pagestyle{{fancy}}
-\fancyhf{{}}
-\lhead{{Team \# XXXXXXX}}  % Replace XXXXXXX with your team number
-\rhead{{Page \thepage\ of \pageref{{LastPage}}}}
-\renewcommand{{\headrulewidth}}{{0pt}}
+\pagestyle{fancy}
+\fancyhf{}
+\lhead{Team \# XXXXXXX}  % Replace XXXXXXX with your team number
+\rhead{Page \thepage\ of \pageref{LastPage}}
+\renewcommand{\headrulewidth}{0pt}
 
-\usepackage{{lastpage}}
+\usepackage{lastpage}
 
 % ----- Custom Commands -----
-\newcommand{{\teamnum}}{{XXXXXXX}}  % Replace with your team number
-\newtheorem{{theorem}}{{Theorem}}
-\newtheorem{{lemma}}{{Lemma}}
-\newtheorem{{definition}}{{Definition}}
+\newcommand{\teamnum}{XXXXXXX}  % Replace with your team number
+\newtheorem{theorem}{Theorem}
+\newtheorem{lemma}{Lemma}
+\newtheorem{definition}{Definition}
 
 % ============================================================================
-\begin{{document}}
+\begin{document}
 
 % ----- Summary Sheet -----
-\input{{sections/summary}}
+\input{sections/summary}
 
 \newpage
-\setcounter{{page}}{{1}}
+\setcounter{page}{1}
 
 % ----- Main Content -----
-\input{{sections/introduction}}
-\input{{sections/assumptions}}
-\input{{sections/model}}
-\input{{sections/results}}
-\input{{sections/sensitivity}}
-\input{{sections/conclusion}}
+\input{sections/introduction}
+\input{sections/assumptions}
+\input{sections/model}
+\input{sections/results}
+\input{sections/sensitivity}
+\input{sections/conclusion}
 
 % ----- References -----
-\bibliographystyle{{plain}}
-\bibliography{{sections/references}}
+\bibliographystyle{plain}
+\bibliography{sections/references}
 
-\end{{document}}
+\end{document}
 '''
 
 SUMMARY_TEX_TEMPLATE = r'''\begin{center}
@@ -335,7 +343,7 @@ REFERENCES_BIB_TEMPLATE = r'''% References for MCM/ICM Paper
 
 DATA_PREPROCESSING_TEMPLATE = '''#!/usr/bin/env python3
 """
-Data Preprocessing Module for MCM/ICM {year} Problem {problem}
+Data Preprocessing Module for MCM/ICM $year Problem $problem
 
 This module handles all data loading, cleaning, and transformation tasks.
 """
@@ -348,19 +356,29 @@ from pathlib import Path
 DATA_RAW = Path(__file__).parent.parent / "data" / "raw"
 DATA_PROCESSED = Path(__file__).parent.parent / "data" / "processed"
 
+# pyarrow's multi-threaded CSV reader is much faster on large files;
+# fall back to pandas' default C parser when it is not installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 
 def load_data(filename: str) -> pd.DataFrame:
     """Load data from the raw data directory."""
     filepath = DATA_RAW / filename
     
     if filepath.suffix == ".csv":
-        return pd.read_csv(filepath)
+        return pd.read_csv(filepath, engine=CSV_ENGINE)
+    elif filepath.suffix == ".parquet":
+        return pd.read_parquet(filepath)
     elif filepath.suffix in [".xlsx", ".xls"]:
         return pd.read_excel(filepath)
     elif filepath.suffix == ".json":
         return pd.read_json(filepath)
     else:
-        raise ValueError(f"Unsupported file format: {{filepath.suffix}}")
+        raise ValueError(f"Unsupported file format: {filepath.suffix}")
 
 
 def clean_data(df: pd.DataFrame) -> pd.DataFrame:
@@ -376,24 +394,38 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def load_data_in_chunks(
+    filename: str, chunk_fn=clean_data, chunksize: int = 500_000
+) -> pd.DataFrame:
+    """Load a large CSV chunk by chunk, applying chunk_fn to each piece.
+    
+    Peak memory stays near one raw chunk plus the result. Duplicates that span
+    chunks are not removed; call drop_duplicates() on the result if needed.
+    """
+    filepath = DATA_RAW / filename
+    # The pyarrow engine does not support chunksize
+    reader = pd.read_csv(filepath, chunksize=chunksize, engine="c")
+    return pd.concat((chunk_fn(chunk) for chunk in reader), ignore_index=True)
+
+
 def save_processed(df: pd.DataFrame, filename: str) -> None:
     """Save processed data."""
     DATA_PROCESSED.mkdir(parents=True, exist_ok=True)
     filepath = DATA_PROCESSED / filename
     df.to_csv(filepath, index=False)
-    print(f"Saved processed data to {{filepath}}")
+    print(f"Saved processed data to {filepath}")
 
 
 if __name__ == "__main__":
     # Example usage
     print("Data preprocessing module ready.")
-    print(f"Raw data directory: {{DATA_RAW}}")
-    print(f"Processed data directory: {{DATA_PROCESSED}}")
+    print(f"Raw data directory: {DATA_RAW}")
+    print(f"Processed data directory: {DATA_PROCESSED}")
 '''
 
 VISUALIZATION_TEMPLATE = '''#!/usr/bin/env python3
 """
-Visualization Module for MCM/ICM {year} Problem {problem}
+Visualization Module for MCM/ICM $year Problem $problem
 
 This module provides visualization functions for the analysis.
 All figures are saved to the paper/figures directory.
@@ -404,7 +436,7 @@ import numpy as np
 from pathlib import Path
 
 # Configure matplotlib for publication-quality figures
-plt.rcParams.update({{
+plt.rcParams.update({
     "font.size": 12,
     "font.family": "serif",
     "figure.figsize": (8, 6),
@@ -413,25 +445,29 @@ plt.rcParams.update({{
     "savefig.bbox": "tight",
     "axes.grid": True,
     "grid.alpha": 0.3,
-}}
+})
 
 # Output directory
 FIGURES_DIR = Path(__file__).parent.parent / "paper" / "figures"
 FIGURES_DIR.mkdir(parents=True, exist_ok=True)
 
+# Above this many points, drawing a marker per point dominates render time
+LARGE_N = 5000
+
 
 def save_figure(fig, name: str, formats=["png", "pdf"]) -> None:
     """Save figure in multiple formats."""
     for fmt in formats:
-        filepath = FIGURES_DIR / f"{{name}}.{{fmt}}"
+        filepath = FIGURES_DIR / f"{name}.{fmt}"
         fig.savefig(filepath)
-        print(f"Saved: {{filepath}}")
+        print(f"Saved: {filepath}")
 
 
 def plot_line(x, y, xlabel="x", ylabel="y", title="", filename="line_plot"):
     """Create a simple line plot."""
     fig, ax = plt.subplots()
-    ax.plot(x, y, marker="o", linewidth=2, markersize=4)
+    marker = "o" if len(x) <= LARGE_N else None
+    ax.plot(x, y, marker=marker, linewidth=2, markersize=4)
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
     if title:
@@ -443,7 +479,11 @@ def plot_line(x, y, xlabel="x", ylabel="y", title="", filename="line_plot"):
 def plot_scatter(x, y, xlabel="x", ylabel="y", title="", filename="scatter_plot"):
     """Create a scatter plot."""
     fig, ax = plt.subplots()
-    ax.scatter(x, y, alpha=0.7, edgecolors="black", linewidth=0.5)
+    if len(x) > LARGE_N:
+        # A single marker-only line renders much faster than a PathCollection
+        ax.plot(x, y, ".", markersize=2, alpha=0.5)
+    else:
+        ax.scatter(x, y, alpha=0.7, edgecolors="black", linewidth=0.5)
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
     if title:
@@ -468,7 +508,7 @@ def plot_heatmap(data, xlabel="x", ylabel="y", title="", filename="heatmap"):
 if __name__ == "__main__":
     # Example usage
     print("Visualization module ready.")
-    print(f"Figures will be saved to: {{FIGURES_DIR}}")
+    print(f"Figures will be saved to: {FIGURES_DIR}")
     
     # Create example plot
     x = np.linspace(0, 10, 50)
@@ -476,16 +516,16 @@ if __name__ == "__main__":
     plot_line(x, y, "Time", "Value", "Example Plot", "example_plot")
 '''
 
-README_TEMPLATE = '''# MCM/ICM {year} - Problem {problem}
+README_TEMPLATE = '''# MCM/ICM $year - Problem $problem
 
-**Team:** {team}  
-**Competition Year:** {year}  
-**Problem Choice:** {problem}
+**Team:** $team  
+**Competition Year:** $year  
+**Problem Choice:** $problem
 
 ## Project Structure
 
 ```
-{project_name}/
+$project_name/
 ├── paper/              # LaTeX paper files
 │   ├── main.tex        # Main document (compile this)
 │   ├── sections/       # Individual sections
@@ -550,12 +590,19 @@ pdflatex main.tex
 _Add your notes here during the competition._
 
 ---
-Created: {date}
+Created: $date
 '''
 
 
-def create_project_structure(problem: str, year: int, team: str, base_path: Path = None):
-    """Create the complete MCM project directory structure."""
+def create_project_structure(
+    problem: str, year: int, team: str, base_path: Optional[Path] = None
+) -> Optional[Path]:
+    """Create the complete MCM project directory structure.
+    
+    Returns:
+        Path to the new project directory, or None if it could not be created
+        (an error message has already been printed).
+    """
     
     if base_path is None:
         base_path = Path.cwd()
@@ -569,6 +616,11 @@ def create_project_structure(problem: str, year: int, team: str, base_path: Path
         print("Please choose a different team name or remove the existing directory.")
         return None
     
+    # Fail before creating anything rather than leave a half-written tree
+    if base_path.exists() and not (base_path.is_dir() and os.access(base_path, os.W_OK)):
+        print(f"Error: Cannot create project in '{base_path}' (not a writable directory).")
+        return None
+    
     print(f"Creating MCM project: {project_name}")
     print("=" * 50)
     
@@ -587,7 +639,9 @@ def create_project_structure(problem: str, year: int, team: str, base_path: Path
     
     # Create LaTeX files
     latex_files = {
-        "paper/main.tex": MAIN_TEX_TEMPLATE.format(problem=problem, year=year),
+        "paper/main.tex": Template(MAIN_TEX_TEMPLATE).substitute(
+            problem=problem, year=year
+        ),
         "paper/sections/summary.tex": SUMMARY_TEX_TEMPLATE,
         "paper/sections/introduction.tex": INTRODUCTION_TEX_TEMPLATE,
         "paper/sections/assumptions.tex": ASSUMPTIONS_TEX_TEMPLATE,
@@ -605,10 +659,10 @@ def create_project_structure(problem: str, year: int, team: str, base_path: Path
     
     # Create Python files
     python_files = {
-        "code/data_preprocessing.py": DATA_PREPROCESSING_TEMPLATE.format(
+        "code/data_preprocessing.py": Template(DATA_PREPROCESSING_TEMPLATE).substitute(
             year=year, problem=problem
         ),
-        "code/visualization.py": VISUALIZATION_TEMPLATE.format(
+        "code/visualization.py": Template(VISUALIZATION_TEMPLATE).substitute(
             year=year, problem=problem
         ),
     }
@@ -624,7 +678,7 @@ def create_project_structure(problem: str, year: int, team: str, base_path: Path
     print(f"  Created: code/models/__init__.py")
     
     # Create README
-    readme_content = README_TEMPLATE.format(
+    readme_content = Template(README_TEMPLATE).substitute(
         year=year,
         problem=problem,
         team=team,
@@ -673,8 +727,7 @@ Thumbs.db
     
     # Create .gitkeep files
     for folder in ["data/raw", "data/processed", "paper/figures"]:
-        gitkeep = project_path / folder / ".gitkeep"
-        gitkeep.write_text("", encoding="utf-8")
+        (project_path / folder / ".gitkeep").touch()
     
     print("=" * 50)
     print(f"Project created successfully!")
@@ -712,8 +765,7 @@ def copy_draft_templates(project_path: Path) -> None:
         target_path = sections_dir / target_name
         
         try:
-            content = draft_file.read_text(encoding="utf-8")
-            target_path.write_text(content, encoding="utf-8")
+            shutil.copyfile(draft_file, target_path)
             print(f"  Copied: {draft_file.name} → {target_name}")
         except Exception as e:
             print(f"  Error copying {draft_file.name}: {e}")
@@ -723,8 +775,7 @@ def copy_draft_templates(project_path: Path) -> None:
     if guide_source.exists():
         guide_target = project_path / "OVERLEAF_GUIDE.md"
         try:
-            content = guide_source.read_text(encoding="utf-8")
-            guide_target.write_text(content, encoding="utf-8")
+            shutil.copyfile(guide_source, guide_target)
             print(f"  Copied: OVERLEAF_GUIDE.md")
         except Exception as e:
             print(f"  Error copying OVERLEAF_GUIDE.md: {e}")
@@ -762,7 +813,7 @@ def copy_deep_templates(project_path: Path) -> None:
         if source.exists():
             target = sections_dir / target_name
             # Overwrite existing empty template
-            target.write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
+            shutil.copyfile(source, target)
             print(f"  [OK] Copied: {deep_file} -> {target_name}")
         else:
             print(f"  Warning: {deep_file} not found")
@@ -873,7 +924,8 @@ Examples:
         "-p", "--problem",
         type=str,
         required=True,
-        choices=["A", "B", "C", "D", "E", "F"],
+        choices=_PROBLEM_CHOICES,
+        metavar="{A-F}",
         help="Problem letter (A-F)"
     )
     
@@ -27,6 +27,7 @@ style_config : Core styling and utilities
     - add_subplot_labels() : Add (a), (b), (c) labels
     - optimize_legend_location() : Smart legend placement
     - save_figure() : Save in multiple formats
+    - get_save_formats() : Output formats from MCM_SAVE_FORMATS
 
 plot_templates.time_series : Time series and forecasts
     - plot_forecast() : Historical + forecast with CI
@@ -48,10 +49,11 @@ plot_templates.phase_portrait : Dynamic systems (Type A)
 plot_templates.network_graph : Networks (Type B, D, F)
     - plot_network_topology() : Node-link diagrams
     - plot_tree_hierarchy() : Tree/hierarchy layouts
+    - spring_layout_lbfgs() : Force-directed layout for large graphs
 
 plot_templates.pareto_frontier : Multi-objective optimization
     - plot_pareto_frontier() : 2D Pareto front
-    - plot_pareto_3d() : 3D scatter for 3 objectives
+    - plot_pareto_3d() : 3D or projected scatter for 3 objectives
     - plot_parallel_coordinates() : Many objectives
     - identify_pareto_front() : Find non-dominated points
 
@@ -82,6 +84,8 @@ from .style_config import (
     latex_label,
     format_scientific,
     save_figure,
+    get_save_formats,
+    PREVIEW_PNG_COMPRESS_LEVEL,
     setup_figure,
 )
 
@@ -123,5 +127,7 @@ __all__ = [
     "latex_label",
     "format_scientific",
     "save_figure",
+    "get_save_formats",
+    "PREVIEW_PNG_COMPRESS_LEVEL",
     "setup_figure",
 ]
@@ -46,6 +46,7 @@ from .phase_portrait import (
 from .network_graph import (
     plot_network_topology,
     plot_tree_hierarchy,
+    spring_layout_lbfgs,
 )
 
 # Pareto frontier (Multi-objective)
@@ -87,6 +88,7 @@ __all__ = [
     # Network
     "plot_network_topology",
     "plot_tree_hierarchy",
+    "spring_layout_lbfgs",
     
     # Pareto
     "plot_pareto_frontier",
@@ -42,6 +42,9 @@ def plot_correlation_matrix(
     # Mask upper triangle for cleaner look (common in academic papers)
     mask = np.triu(np.ones_like(corr, dtype=bool))
     
+    # Format all annotation strings in one vectorized pass
+    annot_labels = np.char.mod('%.2f', np.asarray(corr, dtype=float))
+    
     sns.heatmap(
         corr,
         mask=mask,
@@ -51,8 +54,8 @@ def plot_correlation_matrix(
         square=True,
         linewidths=.5,
         cbar_kws={"shrink": .7},
-        annot=True,     # Show numbers
-        fmt=".2f",      # 2 decimal places
+        annot=annot_labels,  # Pre-formatted, 2 decimal places
+        fmt="",
         annot_kws={"size": 8},
         ax=ax
     )
@@ -22,12 +22,13 @@ def create_grid_layout(
     ncols: int = 2,
     figsize: Optional[Tuple[float, float]] = None,
     suptitle: str = "",
-    sharex: bool = False,
-    sharey: bool = False,
+    sharex: Union[bool, str] = False,
+    sharey: Union[bool, str] = False,
     add_labels: bool = True,
     label_style: str = 'parentheses',
     wspace: float = 0.3,
     hspace: float = 0.35,
+    constrained_layout: bool = False,
 ) -> Tuple[plt.Figure, np.ndarray]:
     """
     Creates a pre-configured grid of subplots with automatic labeling.
@@ -37,12 +38,19 @@ def create_grid_layout(
         ncols: Number of columns
         figsize: Tuple (width, height). Auto-calculated if None.
         suptitle: Main figure title (optional)
-        sharex: Share x-axis across columns
-        sharey: Share y-axis across rows
+        sharex: Share x-axis: True/'all', 'col' (per column), 'row' or False.
+                Shared axes only draw tick labels on the outer panels.
+        sharey: Share y-axis: True/'all', 'row' (per row), 'col' or False
         add_labels: Automatically add (a), (b), (c) labels
         label_style: 'parentheses', 'plain', or 'caps'
-        wspace: Width spacing between subplots
-        hspace: Height spacing between subplots
+        wspace: Width spacing between subplots (only used without
+                constrained_layout)
+        hspace: Height spacing between subplots (only used without
+                constrained_layout)
+        constrained_layout: Let matplotlib's constrained layout engine
+                            place panels, labels and suptitle at draw time,
+                            so callers do not need plt.tight_layout()
+                            (default False keeps wspace/hspace in effect)
         
     Returns:
         fig: Figure object
@@ -61,15 +69,21 @@ def create_grid_layout(
         figsize=figsize,
         sharex=sharex,
         sharey=sharey,
-        squeeze=False  # Always return 2D array
+        squeeze=False,  # Always return 2D array
+        constrained_layout=constrained_layout
     )
     
-    # Adjust spacing
-    fig.subplots_adjust(wspace=wspace, hspace=hspace)
+    # Adjust spacing (constrained layout manages it on its own)
+    if not constrained_layout:
+        fig.subplots_adjust(wspace=wspace, hspace=hspace)
     
-    # Add suptitle if provided
+    # Add suptitle if provided; constrained layout reserves room for it
+    # only when its position is left automatic
     if suptitle:
-        fig.suptitle(suptitle, fontsize=14, fontweight='bold', y=1.02)
+        if constrained_layout:
+            fig.suptitle(suptitle, fontsize=14, fontweight='bold')
+        else:
+            fig.suptitle(suptitle, fontsize=14, fontweight='bold', y=1.02)
     
     # Add subplot labels
     if add_labels:
@@ -211,7 +225,9 @@ if __name__ == "__main__":
     import numpy as np
     
     # Example 1: Standard 2x2 grid
-    fig, axes = create_grid_layout(2, 2, suptitle="Model Results Comparison")
+    fig, axes = create_grid_layout(
+        2, 2, suptitle="Model Results Comparison", constrained_layout=True
+    )
     
     x = np.linspace(0, 10, 50)
     
@@ -227,7 +243,6 @@ if __name__ == "__main__":
     axes[1, 1].plot(x, np.cos(2*x))
     axes[1, 1].set_title("Scenario 4")
     
-    plt.tight_layout()
     plt.show()
     
     # Example 2: Asymmetric layout
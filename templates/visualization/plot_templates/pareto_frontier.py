@@ -12,6 +12,8 @@ Includes support for:
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 from typing import Tuple, Optional, List, Union
 from ..style_config import use_mcm_style, COLORS, DIMENSIONS, save_figure
 
@@ -25,6 +27,10 @@ def identify_pareto_front(
     """
     Identifies Pareto-optimal (non-dominated) points.
     
+    Uses a sort-then-sweep skyline (O(n log n)): after sorting by x, a point
+    is non-dominated only if its y beats the running minimum of all points
+    before it. Identical points do not dominate each other.
+    
     Args:
         x: Array of objective 1 values
         y: Array of objective 2 values
@@ -38,20 +44,34 @@ def identify_pareto_front(
     y = np.asarray(y)
     n = len(x)
     
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    
     # Adjust signs based on optimization direction
     x_adj = x if minimize_x else -x
     y_adj = y if minimize_y else -y
     
-    is_pareto = np.ones(n, dtype=bool)
+    # Sort by x, breaking ties by y
+    order = np.lexsort((y_adj, x_adj))
+    xs = x_adj[order]
+    ys = y_adj[order]
+    
+    # Best y seen strictly before each point in sweep order
+    best_before = np.empty(n, dtype=float)
+    best_before[0] = np.inf
+    best_before[1:] = np.minimum.accumulate(ys)[:-1]
     
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                # Check if point j dominates point i
-                if (x_adj[j] <= x_adj[i] and y_adj[j] <= y_adj[i] and 
-                    (x_adj[j] < x_adj[i] or y_adj[j] < y_adj[i])):
-                    is_pareto[i] = False
-                    break
+    # Runs of identical points share the verdict of their first member
+    new_run = np.ones(n, dtype=bool)
+    new_run[1:] = (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])
+    run_id = np.cumsum(new_run) - 1
+    run_start = np.flatnonzero(new_run)
+    
+    sorted_mask = (ys < best_before)[run_start][run_id]
+    
+    # Undo the sort permutation
+    is_pareto = np.empty(n, dtype=bool)
+    is_pareto[order] = sorted_mask
     
     return is_pareto
 
@@ -266,24 +286,49 @@ def plot_pareto_3d(
     xlabel: str = "Objective 1",
     ylabel: str = "Objective 2",
     zlabel: str = "Objective 3",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    mode: str = "3d"
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
-    Creates a 3D scatter plot for three-objective optimization.
+    Creates a scatter plot for three-objective optimization.
     Note: For 3+ objectives, use parallel coordinates (see below).
-    """
-    use_mcm_style()
     
-    from mpl_toolkits.mplot3d import Axes3D
+    Args:
+        x, y, z: Arrays of objective 1, 2 and 3 values
+        title: Chart title
+        xlabel, ylabel, zlabel: Axis labels (zlabel becomes the colorbar
+            label in 'projected' mode)
+        save_path: Path to save figure
+        mode: '3d' for an mplot3d scatter, or 'projected' for a 2D x-y
+            scatter color-coded by z (much cheaper to render, and easier
+            to read in print)
+    
+    Returns:
+        (fig, ax) tuple
     
-    fig = plt.figure(figsize=DIMENSIONS['square'])
-    ax = fig.add_subplot(111, projection='3d')
+    Raises:
+        ValueError: If mode is not '3d' or 'projected'.
+    """
+    use_mcm_style()
     
-    ax.scatter(x, y, z, c=COLORS['blue'], s=50, alpha=0.7)
+    if mode == 'projected':
+        fig, ax = plt.subplots(figsize=DIMENSIONS['square'])
+        sc = ax.scatter(x, y, c=z, cmap='viridis', s=50, alpha=0.8,
+                        edgecolors='white', linewidth=0.5)
+        cbar = fig.colorbar(sc, ax=ax, shrink=0.8)
+        cbar.set_label(zlabel)
+    elif mode == '3d':
+        from mpl_toolkits.mplot3d import Axes3D
+        
+        fig = plt.figure(figsize=DIMENSIONS['square'])
+        ax = fig.add_subplot(111, projection='3d')
+        ax.scatter(x, y, z, c=COLORS['blue'], s=50, alpha=0.7)
+        ax.set_zlabel(zlabel)
+    else:
+        raise ValueError(f"mode must be '3d' or 'projected', got {mode!r}")
     
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
-    ax.set_zlabel(zlabel)
     ax.set_title(title)
     
     if save_path:
@@ -327,14 +372,24 @@ def plot_parallel_coordinates(
     
     x_coords = np.arange(n_objectives)
     
-    # Plot all solutions
-    for i in range(n_solutions):
-        if pareto_mask is not None and pareto_mask[i]:
-            ax.plot(x_coords, data_norm[i], color=COLORS['blue'], 
-                   alpha=0.7, linewidth=2)
-        else:
-            ax.plot(x_coords, data_norm[i], color=COLORS['gray'], 
-                   alpha=0.3, linewidth=1)
+    # Plot all solutions as a single LineCollection (one artist, one draw call)
+    if pareto_mask is None:
+        is_pareto = np.zeros(n_solutions, dtype=bool)
+    else:
+        is_pareto = np.asarray(pareto_mask, dtype=bool)
+    
+    segments = np.stack(
+        [np.broadcast_to(x_coords, data_norm.shape), data_norm], axis=-1
+    )
+    colors = np.where(
+        is_pareto[:, None],
+        to_rgba(COLORS['blue'], alpha=0.7),
+        to_rgba(COLORS['gray'], alpha=0.3)
+    )
+    linewidths = np.where(is_pareto, 2.0, 1.0)
+    
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=linewidths))
+    ax.autoscale_view()
     
     # Set x-ticks
     ax.set_xticks(x_coords)
@@ -364,12 +419,12 @@ def plot_parallel_coordinates(
 
 if __name__ == "__main__":
     # Generate sample multi-objective optimization data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n = 50
     
     # Simulated trade-off: as x increases, y tends to decrease
-    x = np.random.uniform(0, 10, n)
-    y = 10 - x + np.random.normal(0, 1.5, n)
+    x = rng.uniform(0, 10, n)
+    y = 10 - x + rng.normal(0, 1.5, n)
     y = np.clip(y, 0, 12)
     
     # Plot Pareto frontier
@@ -384,8 +439,8 @@ if __name__ == "__main__":
     plt.show()
     
     # Multi-objective parallel coordinates example
-    data = np.random.rand(30, 5) * 10
-    pareto_mask = np.random.random(30) > 0.7
+    data = rng.uniform(0, 10, (30, 5))
+    pareto_mask = rng.random(30) > 0.7
     
     fig2, ax2 = plot_parallel_coordinates(
         data,
@@ -14,6 +14,36 @@ import numpy as np
 from typing import Callable, Tuple, Optional, List
 from ..style_config import use_mcm_style, COLORS, DIMENSIONS, save_figure
 
+def _evaluate_on_grid(
+    func: Callable,
+    X: np.ndarray,
+    Y: np.ndarray,
+    args: Tuple = ()
+) -> np.ndarray:
+    """
+    Evaluates func(x, y, *args) over a meshgrid.
+    
+    Tries a single vectorized call on the whole grid first; falls back to
+    point-by-point evaluation for functions that only accept scalars
+    (e.g. ones using math.* or if/else on the inputs).
+    """
+    try:
+        result = np.asarray(func(X, Y, *args), dtype=float)
+        if result.shape == X.shape:
+            return result
+        if result.ndim == 0:
+            # Constant field, e.g. dx/dt = 1
+            return np.full(X.shape, float(result))
+    except (TypeError, ValueError):
+        pass
+    
+    result = np.empty(X.shape, dtype=float)
+    for i in range(X.shape[0]):
+        for j in range(X.shape[1]):
+            result[i, j] = func(X[i, j], Y[i, j], *args)
+    return result
+
+
 def plot_phase_portrait(
     dxdt_func: Callable,
     dydt_func: Callable,
@@ -53,14 +83,8 @@ def plot_phase_portrait(
     X, Y = np.meshgrid(x, y)
     
     # Compute derivatives
-    DX = np.zeros_like(X)
-    DY = np.zeros_like(Y)
-    
-    # We iterate because functions might not be vectorized
-    for i in range(X.shape[0]):
-        for j in range(X.shape[1]):
-            DX[i, j] = dxdt_func(X[i, j], Y[i, j], *args)
-            DY[i, j] = dydt_func(X[i, j], Y[i, j], *args)
+    DX = _evaluate_on_grid(dxdt_func, X, Y, args)
+    DY = _evaluate_on_grid(dydt_func, X, Y, args)
             
     # Normalize for color mapping (speed)
     speed = np.sqrt(DX**2 + DY**2)
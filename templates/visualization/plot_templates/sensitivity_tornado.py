@@ -328,12 +328,12 @@ if __name__ == "__main__":
     
     # Simulated sensitivity results (output values at ±10% perturbation)
     baseline = 100
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Low values (parameter decreased by 10%)
-    low = baseline + np.random.uniform(-20, -2, len(params))
+    low = baseline + rng.uniform(-20, -2, len(params))
     # High values (parameter increased by 10%)  
-    high = baseline + np.random.uniform(2, 25, len(params))
+    high = baseline + rng.uniform(2, 25, len(params))
     
     fig, ax = plot_tornado(
         params, low, high,
@@ -6,6 +6,7 @@ visual identity across all generated charts.
 v1.2.0 - Added subplot labels, legend optimization, save utilities
 """
 
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
 import os
@@ -57,14 +58,28 @@ SUBPLOT_LABELS = list('abcdefghijklmnopqrstuvwxyz')
 # Setup Functions
 # =============================================================================
 
+# Parsed contents of mcm_style.mplstyle, filled on first use_mcm_style() call
+_STYLE_CACHE: Optional[dict] = None
+
+
 def use_mcm_style():
     """
     Applies the MCM matplotlib style sheet.
     Call this function before creating any plots.
+    
+    The style sheet is parsed once and cached; later calls (every plot
+    template makes one) only re-apply the cached rcParams.
     """
+    global _STYLE_CACHE
+    
     style_path = Path(__file__).parent / 'mcm_style.mplstyle'
-    if style_path.exists():
-        plt.style.use(str(style_path))
+    if _STYLE_CACHE is None and style_path.exists():
+        _STYLE_CACHE = dict(
+            mpl.rc_params_from_file(str(style_path), use_default_template=False)
+        )
+    
+    if _STYLE_CACHE is not None:
+        plt.style.use(_STYLE_CACHE)
     else:
         # Fallback if style file is missing
         print(f"Warning: Style file not found at {style_path}. Using defaults.")
@@ -243,13 +258,39 @@ def format_scientific(value: float, precision: int = 2) -> str:
 # Save Utilities
 # =============================================================================
 
+# zlib level for quick preview PNGs: fastest encode, slightly larger files
+PREVIEW_PNG_COMPRESS_LEVEL = 1
+
+
+def get_save_formats(default: str = 'png') -> List[str]:
+    """
+    Reads output formats from the MCM_SAVE_FORMATS environment variable.
+    
+    Args:
+        default: Comma-separated formats used when the variable is unset or
+            empty (e.g. 'png' or 'png,pdf')
+    
+    Returns:
+        List of formats for save_figure, e.g. MCM_SAVE_FORMATS=png,pdf
+        gives ['png', 'pdf']
+    """
+    formats = [
+        fmt.strip() for fmt in os.environ.get('MCM_SAVE_FORMATS', '').split(',')
+        if fmt.strip()
+    ]
+    if not formats:
+        formats = [fmt.strip() for fmt in default.split(',') if fmt.strip()]
+    return formats
+
+
 def save_figure(
     fig: plt.Figure,
     name: str,
     output_dir: Optional[Path] = None,
     formats: List[str] = ['png', 'pdf'],
     dpi: int = 300,
-    transparent: bool = False
+    transparent: bool = False,
+    png_compress_level: Optional[int] = None
 ) -> List[Path]:
     """
     Saves figure in multiple formats.
@@ -261,6 +302,8 @@ def save_figure(
         formats: List of formats ['png', 'pdf', 'svg']
         dpi: Resolution for raster formats
         transparent: Whether background is transparent
+        png_compress_level: zlib level (0-9) for PNG output. None keeps
+            matplotlib's default; 1 encodes fastest, 9 gives the smallest files.
     
     Returns:
         List of saved file paths
@@ -275,13 +318,18 @@ def save_figure(
     saved_paths = []
     for fmt in formats:
         filepath = output_dir / f"{name}.{fmt}"
+        # PNG encoding is dominated by zlib; pass the level straight to Pillow
+        extra_kwargs = {}
+        if fmt == 'png' and png_compress_level is not None:
+            extra_kwargs['pil_kwargs'] = {'compress_level': png_compress_level}
         fig.savefig(
             filepath,
             format=fmt,
             dpi=dpi if fmt != 'pdf' else None,
             transparent=transparent,
             bbox_inches='tight',
-            pad_inches=0.1
+            pad_inches=0.1,
+            **extra_kwargs
         )
         saved_paths.append(filepath)
         print(f"Saved: {filepath}")